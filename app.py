@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, send_from_directory, session
+from flask import Flask, request, jsonify, session, make_response, abort, g, has_request_context
 from flask_cors import CORS
 from flask_session import Session
 import os
@@ -7,6 +7,23 @@ from bs4 import BeautifulSoup
 import time
 from urllib.parse import urljoin, quote_plus
 import re
+import gzip
+import hashlib
+import mimetypes
+import cProfile
+import pstats
+import hmac
+import json
+import random
+import threading
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Brotli is optional; fall back to gzip only
 
 app = Flask(__name__)
 
@@ -28,6 +45,217 @@ sess.init_app(app)
 BASE_URL = 'https://tonepoet.fans'
 REAL_DEBRID_API_BASE = 'https://api.real-debrid.com/rest/1.0'
 
+# Response compression settings
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/css', 'text/javascript', 'application/javascript'}
+COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies aren't worth the CPU or the header overhead
+# Brotli quality: max for assets compressed once at startup, low for per-request bodies
+# (quality 11 takes hundreds of ms on a large search response; 5 takes a few)
+BROTLI_STATIC_QUALITY = 11
+BROTLI_DYNAMIC_QUALITY = 5
+
+# Static assets that get fingerprinted and precompressed at startup
+FINGERPRINTED_ASSETS = ['js/app.js', 'css/style.css']
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def compress_body(data, encoding, brotli_quality=BROTLI_DYNAMIC_QUALITY):
+    """Compress bytes with the given content encoding ('br' or 'gzip')"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    # mtime=0 keeps the output deterministic so ETags stay stable across requests
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+def preferred_encoding():
+    """Pick the best content encoding the client accepts, or None"""
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+def build_static_assets():
+    """Fingerprint and precompress the main static assets
+    Returns: (assets, asset_urls)
+    - assets: fingerprinted filename -> dict with mimetype, etag and body per encoding
+    - asset_urls: original /static URL -> fingerprinted /assets URL
+    """
+    assets = {}
+    asset_urls = {}
+    for filename in FINGERPRINTED_ASSETS:
+        path = os.path.join(app.static_folder, filename)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Skipping static asset {filename}: {e}")
+            continue
+        
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        base, ext = os.path.splitext(filename)
+        fingerprinted = f"{base}.{digest}{ext}"
+        
+        bodies = {None: data, 'gzip': compress_body(data, 'gzip')}
+        if brotli is not None:
+            bodies['br'] = compress_body(data, 'br', brotli_quality=BROTLI_STATIC_QUALITY)
+        
+        assets[fingerprinted] = {
+            'mimetype': mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            'etag': digest,
+            'bodies': bodies
+        }
+        asset_urls[f"/static/{filename}"] = f"/assets/{fingerprinted}"
+    return assets, asset_urls
+
+STATIC_ASSETS, ASSET_URLS = build_static_assets()
+
+# Request profiling settings
+# - PROFILE_ADMIN_TOKEN: enables on-demand profiling (?profile=1 or X-Profile: 1, plus X-Admin-Token)
+# - PROFILE_SAMPLE_RATE: fraction of requests (0.0-1.0) profiled in the background
+# - PROFILE_DIR: where profiles are written for later analysis
+# - PROFILE_MAX_FILES: cap on files kept in PROFILE_DIR; the oldest are pruned first
+PROFILE_ADMIN_TOKEN = os.environ.get('PROFILE_ADMIN_TOKEN', '')
+try:
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+except ValueError:
+    print("WARNING: PROFILE_SAMPLE_RATE is not a number. Sampled profiling disabled.")
+    PROFILE_SAMPLE_RATE = 0.0
+PROFILE_DIR = os.environ.get('PROFILE_DIR', 'profiles')
+try:
+    PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', '200'))
+except ValueError:
+    print("WARNING: PROFILE_MAX_FILES is not a number. Using 200.")
+    PROFILE_MAX_FILES = 200
+if PROFILE_MAX_FILES < 2:
+    # Keep at least one .prof/.json pair so the profile just written survives pruning
+    print("WARNING: PROFILE_MAX_FILES must be at least 2. Using 2.")
+    PROFILE_MAX_FILES = 2
+PROFILE_TOP_FUNCTIONS = 25
+
+# Only one cProfile profiler can be active per process (enforced on Python 3.12+)
+profiler_lock = threading.Lock()
+
+@contextmanager
+def profile_stage(name):
+    """Accumulate wall time for a named stage when the current request is being profiled"""
+    stages = g.get('profile_stages') if has_request_context() else None
+    if stages is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + (time.perf_counter() - start)
+
+def profile_requested():
+    """Check if the request asks for on-demand profiling
+    Returns: (requested, authorized)
+    """
+    requested = request.args.get('profile') == '1' or request.headers.get('X-Profile') == '1'
+    if not requested:
+        return False, False
+    token = request.headers.get('X-Admin-Token', '')
+    authorized = bool(PROFILE_ADMIN_TOKEN) and hmac.compare_digest(token.encode(), PROFILE_ADMIN_TOKEN.encode())
+    return True, authorized
+
+def build_profile_report(profiler, stages, elapsed):
+    """Summarize a profiler run: total time, per-stage breakdown and top functions by cumulative time"""
+    stats = pstats.Stats(profiler)
+    top_functions = []
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    for (filename, line, func), (_, num_calls, total_time, cumulative_time, _) in entries[:PROFILE_TOP_FUNCTIONS]:
+        top_functions.append({
+            'function': f"{func} ({os.path.basename(filename)}:{line})",
+            'calls': num_calls,
+            'totalMs': round(total_time * 1000, 2),
+            'cumulativeMs': round(cumulative_time * 1000, 2)
+        })
+    
+    stage_ms = {name: round(seconds * 1000, 2) for name, seconds in stages.items()}
+    stage_ms['other'] = round(max(elapsed - sum(stages.values()), 0.0) * 1000, 2)
+    
+    return {
+        'path': request.full_path,
+        'totalMs': round(elapsed * 1000, 2),
+        'stages': stage_ms,
+        'topFunctions': top_functions
+    }
+
+def save_profile(profiler, report):
+    """Write the raw profile (.prof, loadable with pstats/snakeviz) and its JSON summary to PROFILE_DIR
+    Returns the .prof path, or None if it couldn't be written"""
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        name = f"{request.endpoint}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        prof_path = os.path.join(PROFILE_DIR, f"{name}.prof")
+        profiler.dump_stats(prof_path)
+        with open(os.path.join(PROFILE_DIR, f"{name}.json"), 'w') as f:
+            json.dump(report, f, indent=2)
+        prune_profiles()
+        return prof_path
+    except OSError as e:
+        print(f"Error saving profile: {e}")
+        return None
+
+def prune_profiles():
+    """Delete the oldest files in PROFILE_DIR so at most PROFILE_MAX_FILES remain"""
+    paths = [os.path.join(PROFILE_DIR, name) for name in os.listdir(PROFILE_DIR)
+             if name.endswith(('.prof', '.json'))]
+    if len(paths) <= PROFILE_MAX_FILES:
+        return
+    paths.sort(key=os.path.getmtime)
+    for path in paths[:len(paths) - PROFILE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Error pruning profile {path}: {e}")
+
+def profiled(view):
+    """Run a view under cProfile when requested by an admin or picked by PROFILE_SAMPLE_RATE"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        requested, authorized = profile_requested()
+        if requested and not authorized:
+            return jsonify({'error': 'Profiling requires a valid admin token'}), 403
+        sampled = not requested and PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+        if not (requested or sampled):
+            return view(*args, **kwargs)
+        
+        # Never fail a user's request over profiling: if another profile is running, skip this one
+        if not profiler_lock.acquire(blocking=False):
+            print(f"Profiler busy, not profiling {request.full_path}")
+            return view(*args, **kwargs)
+        try:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Another profiling tool (e.g. a debugger) is active in this process
+                print(f"Could not start profiler: {e}")
+                return view(*args, **kwargs)
+            
+            g.profile_stages = {}
+            start = time.perf_counter()
+            try:
+                rv = view(*args, **kwargs)
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - start
+        finally:
+            profiler_lock.release()
+        
+        report = build_profile_report(profiler, g.profile_stages, elapsed)
+        prof_path = save_profile(profiler, report)
+        print(f"Profiled {request.full_path} in {report['totalMs']} ms, stages: {report['stages']}")
+        
+        response = make_response(rv)
+        if requested:
+            # Hand the summary back to the admin alongside the normal payload
+            data = response.get_json(silent=True)
+            if isinstance(data, dict):
+                data['profile'] = report
+                response.set_data(json.dumps(data))
+            if prof_path:
+                response.headers['X-Profile-File'] = prof_path
+        return response
+    return wrapper
+
 def get_authenticated_session():
     """Get or create a requests session with user's forum cookies"""
     # Create a new session and restore cookies from Flask session
@@ -127,8 +355,61 @@ def check_auth_required(url):
 
 @app.route('/')
 def index():
-    """Serve the main HTML page"""
-    return send_from_directory('.', 'index.html')
+    """Serve the main HTML page, pointing it at the fingerprinted static assets"""
+    with open(os.path.join(app.root_path, 'index.html'), encoding='utf-8') as f:
+        html = f.read()
+    for original_url, asset_url in ASSET_URLS.items():
+        html = html.replace(original_url, asset_url)
+    
+    response = make_response(html)
+    response.mimetype = 'text/html'
+    # Always revalidate the page itself so new asset fingerprints are picked up
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/assets/<path:filename>')
+def fingerprinted_asset(filename):
+    """Serve a fingerprinted, precompressed static asset with immutable caching"""
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        abort(404)
+    
+    encoding = preferred_encoding()
+    response = make_response(asset['bodies'].get(encoding, asset['bodies'][None]))
+    response.mimetype = asset['mimetype']
+    if encoding in asset['bodies'] and encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f"{asset['etag']}-{encoding}")
+    else:
+        response.set_etag(asset['etag'])
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = ASSET_CACHE_CONTROL
+    return response.make_conditional(request)
+
+@app.after_request
+def compress_response(response):
+    """Compress text responses and make /search and / conditional on a strong ETag"""
+    if (response.direct_passthrough or
+            response.status_code != 200 or
+            'Content-Encoding' in response.headers or
+            response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    encoding = preferred_encoding()
+    if encoding and len(data) >= COMPRESS_MIN_SIZE:
+        response.set_data(compress_body(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+    
+    if request.endpoint in ('search', 'index'):
+        # ETag is computed over the encoded body, so each encoding gets its own tag
+        if request.endpoint == 'search':
+            # Results depend on the user's cookies: cacheable by the browser only, always revalidated
+            response.headers['Cache-Control'] = 'private, no-cache'
+        response.add_etag()
+        response = response.make_conditional(request)
+    return response
 
 def parse_netscape_cookies(cookie_file_content):
     """Parse Netscape cookie format (from browser extensions like cookies.txt)
@@ -372,6 +653,171 @@ def realdebrid_unrestrict():
         print(f"Error in Real-Debrid unrestrict: {e}")
         return jsonify({'error': str(e)}), 500
 
+def find_auth_indicator(soup, response, query):
+    """Scan a parsed search results page for signs that login is required
+    Returns True if authentication is required"""
+    # First-post authentication check: if the first post body shows restricted message, require login
+    try:
+        first_post_elem = None
+        tentative_posts = soup.find_all(['article', 'div'], class_=lambda x: x and ('post' in x.lower() or 'entry' in x.lower()))
+        if tentative_posts:
+            first_post_elem = tentative_posts[0]
+        else:
+            first_heading = soup.find('h2')
+            if first_heading:
+                first_post_elem = first_heading.find_parent(['article', 'div']) or first_heading
+        if first_post_elem is not None:
+            first_post_html = str(first_post_elem).lower()
+            if ('members-access-error' in first_post_html) or ('sorry, but you do not have permission to view this content' in first_post_html):
+                print("Authentication required: first post is restricted")
+                return True
+    except Exception as _:
+        # Non-fatal: continue with other detection methods
+        pass
+    
+    # Check if authentication is required
+    # Look for common login page indicators
+    page_text = soup.get_text().lower()
+    page_html = str(soup).lower()
+    page_title = soup.find('title')
+    title_text = page_title.get_text().lower() if page_title else ''
+    
+    # Check for the exact permission error text or partial matches
+    response_text = response.text
+    response_lower = response_text.lower()
+    
+    # Check for various forms of the permission error
+    permission_indicators = [
+        'sorry, but you do not have permission to view this content',
+        'do not have permission to view this content',
+        'please register in order to view this',
+        'members-access-error'
+    ]
+    
+    for indicator in permission_indicators:
+        if indicator in response_lower:
+            print(f"Authentication required: found '{indicator}'")
+            return True
+    
+    # Try multiple ways to find it in parsed soup
+    members_error_div = (soup.find('div', class_='members-access-error') or 
+                        soup.find('div', class_=lambda x: x and 'members-access-error' in str(x) if x else False))
+    if members_error_div:
+        print(f"Authentication required: found members-access-error div")
+        return True
+    
+    # Check for login page indicators
+    login_indicators = [
+        'wp-login.php' in response.url.lower(),
+        'log in' in title_text,
+        'login' in title_text and 'required' in page_text,
+        soup.find('form', {'id': 'loginform'}),
+        soup.find('form', {'name': 'loginform'}),
+        'you must be logged in' in page_text,
+        'please log in' in page_text,
+        'login required' in page_text,
+        'you do not have permission to view this content' in page_text,
+        'members-access-error' in page_html,
+        'please register in order to view this' in page_text,
+        'do not have permission' in page_text
+    ]
+    
+    requires_auth = any(login_indicators)
+    
+    if requires_auth:
+        print(f"Authentication required detected for query: {query}")
+        return True
+    
+    return False
+
+def extract_search_posts(soup):
+    """Extract title/url/date entries from a parsed search results page
+    Returns tuple: (posts, restricted_posts_count, total_posts_found)"""
+    posts = []
+    # Find all post entries in search results
+    # Look for divs with id="post-XXXX" pattern (actual search result posts)
+    # Or h2.entry-title elements (post titles in search results)
+    
+    # Method 1: Find divs with post-XXXX id pattern
+    post_elements = soup.find_all('div', id=lambda x: x and x.startswith('post-'))
+    
+    # Method 2: If that doesn't work, find h2.entry-title elements
+    if not post_elements:
+        entry_titles = soup.find_all('h2', class_='entry-title')
+        for h2 in entry_titles:
+            # Find the parent post div
+            parent_post = h2.find_parent('div', id=lambda x: x and x.startswith('post-'))
+            if parent_post:
+                post_elements.append(parent_post)
+    
+    # Check if all posts have restricted content
+    restricted_posts_count = 0
+    total_posts_found = 0
+    
+    for post_elem in post_elements:
+        # Find the h2.entry-title link inside this post
+        entry_title = post_elem.find('h2', class_='entry-title')
+        if entry_title:
+            link = entry_title.find('a')
+            if link:
+                total_posts_found += 1
+                post_url = urljoin(BASE_URL, link.get('href', ''))
+                post_title = link.get_text(strip=True) or link.get('title', '')
+                
+                # Check if this post has restricted content
+                if post_elem.find('div', class_=lambda x: x and 'members-access-error' in str(x).lower() if x else False):
+                    restricted_posts_count += 1
+                
+                # Try to find date nearby
+                date_elem = post_elem.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
+                post_date = date_elem.get_text(strip=True) if date_elem else ''
+                
+                posts.append({
+                    'title': post_title,
+                    'url': post_url,
+                    'date': post_date
+                })
+    
+    return posts, restricted_posts_count, total_posts_found
+
+def extract_album_links(soup, query):
+    """Extract hexload.com album links whose text matches the query from a parsed post page"""
+    album_links = []
+    
+    # Find ALL links on the page - no need to find specific divs
+    all_links = soup.find_all('a', href=True)
+    
+    query_lower = query.lower()
+    hexload_count = 0
+    matching_count = 0
+    
+    for link in all_links:
+        link_url = link.get('href', '')
+        link_text = link.get_text(strip=True)
+        
+        # Filter: only hexload.com links
+        if 'hexload.com' not in link_url:
+            continue
+        
+        hexload_count += 1
+        
+        # Filter: link text must contain the query
+        if not link_text or query_lower not in link_text.lower():
+            continue
+        
+        matching_count += 1
+        # Make sure URL is absolute
+        full_url = urljoin(BASE_URL, link_url)
+        
+        album_links.append({
+            'text': link_text,
+            'url': full_url
+        })
+    
+    print(f"  DEBUG: Total hexload.com links found: {hexload_count}")
+    print(f"  DEBUG: Links matching query '{query}': {matching_count}")
+    return album_links
+
 def scrape_search_results(query):
     """Scrape the forum search results page and extract post information
     Returns tuple: (posts, requires_auth) where requires_auth is True if login is needed"""
@@ -381,8 +827,9 @@ def scrape_search_results(query):
     user_session = get_authenticated_session()
     
     try:
-        response = user_session.get(search_url, timeout=10, allow_redirects=True)
-        response.raise_for_status()
+        with profile_stage('network'):
+            response = user_session.get(search_url, timeout=10, allow_redirects=True)
+            response.raise_for_status()
         
         # Update Flask session with any new cookies WordPress might have set
         update_session_cookies(user_session)
@@ -393,124 +840,16 @@ def scrape_search_results(query):
         print(f"Response length: {len(response.text)} bytes")
         print(f"Cookies in request: {list(user_session.cookies.keys())}")
         
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # First-post authentication check: if the first post body shows restricted message, require login
-        try:
-            first_post_elem = None
-            tentative_posts = soup.find_all(['article', 'div'], class_=lambda x: x and ('post' in x.lower() or 'entry' in x.lower()))
-            if tentative_posts:
-                first_post_elem = tentative_posts[0]
-            else:
-                first_heading = soup.find('h2')
-                if first_heading:
-                    first_post_elem = first_heading.find_parent(['article', 'div']) or first_heading
-            if first_post_elem is not None:
-                first_post_html = str(first_post_elem).lower()
-                if ('members-access-error' in first_post_html) or ('sorry, but you do not have permission to view this content' in first_post_html):
-                    print("Authentication required: first post is restricted")
-                    return [], True
-        except Exception as _:
-            # Non-fatal: continue with other detection methods
-            pass
-        
-        # Check if authentication is required
-        # Look for common login page indicators
-        page_text = soup.get_text().lower()
-        page_html = str(soup).lower()
-        page_title = soup.find('title')
-        title_text = page_title.get_text().lower() if page_title else ''
-        
-        # Check for the exact permission error text or partial matches
-        response_text = response.text
-        response_lower = response_text.lower()
-        
-        # Check for various forms of the permission error
-        permission_indicators = [
-            'sorry, but you do not have permission to view this content',
-            'do not have permission to view this content',
-            'please register in order to view this',
-            'members-access-error'
-        ]
-        
-        for indicator in permission_indicators:
-            if indicator in response_lower:
-                print(f"Authentication required: found '{indicator}'")
-                return [], True
-        
-        # Try multiple ways to find it in parsed soup
-        members_error_div = (soup.find('div', class_='members-access-error') or 
-                            soup.find('div', class_=lambda x: x and 'members-access-error' in str(x) if x else False))
-        if members_error_div:
-            print(f"Authentication required: found members-access-error div")
-            return [], True
-        
-        # Check for login page indicators
-        login_indicators = [
-            'wp-login.php' in response.url.lower(),
-            'log in' in title_text,
-            'login' in title_text and 'required' in page_text,
-            soup.find('form', {'id': 'loginform'}),
-            soup.find('form', {'name': 'loginform'}),
-            'you must be logged in' in page_text,
-            'please log in' in page_text,
-            'login required' in page_text,
-            'you do not have permission to view this content' in page_text,
-            'members-access-error' in page_html,
-            'please register in order to view this' in page_text,
-            'do not have permission' in page_text
-        ]
-        
-        requires_auth = any(login_indicators)
+        with profile_stage('parse'):
+            soup = BeautifulSoup(response.content, 'lxml')
         
+        with profile_stage('auth_checks'):
+            requires_auth = find_auth_indicator(soup, response, query)
         if requires_auth:
-            print(f"Authentication required detected for query: {query}")
             return [], True
         
-        posts = []
-        # Find all post entries in search results
-        # Look for divs with id="post-XXXX" pattern (actual search result posts)
-        # Or h2.entry-title elements (post titles in search results)
-        
-        # Method 1: Find divs with post-XXXX id pattern
-        post_elements = soup.find_all('div', id=lambda x: x and x.startswith('post-'))
-        
-        # Method 2: If that doesn't work, find h2.entry-title elements
-        if not post_elements:
-            entry_titles = soup.find_all('h2', class_='entry-title')
-            for h2 in entry_titles:
-                # Find the parent post div
-                parent_post = h2.find_parent('div', id=lambda x: x and x.startswith('post-'))
-                if parent_post:
-                    post_elements.append(parent_post)
-        
-        # Check if all posts have restricted content
-        restricted_posts_count = 0
-        total_posts_found = 0
-        
-        for post_elem in post_elements:
-            # Find the h2.entry-title link inside this post
-            entry_title = post_elem.find('h2', class_='entry-title')
-            if entry_title:
-                link = entry_title.find('a')
-                if link:
-                    total_posts_found += 1
-                    post_url = urljoin(BASE_URL, link.get('href', ''))
-                    post_title = link.get_text(strip=True) or link.get('title', '')
-                    
-                    # Check if this post has restricted content
-                    if post_elem.find('div', class_=lambda x: x and 'members-access-error' in str(x).lower() if x else False):
-                        restricted_posts_count += 1
-                    
-                    # Try to find date nearby
-                    date_elem = post_elem.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
-                    post_date = date_elem.get_text(strip=True) if date_elem else ''
-                    
-                    posts.append({
-                        'title': post_title,
-                        'url': post_url,
-                        'date': post_date
-                    })
+        with profile_stage('link_extraction'):
+            posts, restricted_posts_count, total_posts_found = extract_search_posts(soup)
         
         # If we found posts but all of them are restricted, require authentication
         # Also check if any posts have restricted content - if most/all do, require auth
@@ -536,48 +875,18 @@ def scrape_post_album_links(post_url, query):
     user_session = get_authenticated_session()
     
     try:
-        response = user_session.get(post_url, timeout=10, allow_redirects=True)
-        response.raise_for_status()
+        with profile_stage('network'):
+            response = user_session.get(post_url, timeout=10, allow_redirects=True)
+            response.raise_for_status()
         
         # Update Flask session with any new cookies WordPress might have set
         update_session_cookies(user_session)
         
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        album_links = []
-        
-        # Find ALL links on the page - no need to find specific divs
-        all_links = soup.find_all('a', href=True)
-        
-        query_lower = query.lower()
-        hexload_count = 0
-        matching_count = 0
-        
-        for link in all_links:
-            link_url = link.get('href', '')
-            link_text = link.get_text(strip=True)
-            
-            # Filter: only hexload.com links
-            if 'hexload.com' not in link_url:
-                continue
-            
-            hexload_count += 1
-            
-            # Filter: link text must contain the query
-            if not link_text or query_lower not in link_text.lower():
-                continue
-            
-            matching_count += 1
-            # Make sure URL is absolute
-            full_url = urljoin(BASE_URL, link_url)
-            
-            album_links.append({
-                'text': link_text,
-                'url': full_url
-            })
+        with profile_stage('parse'):
+            soup = BeautifulSoup(response.content, 'lxml')
         
-        print(f"  DEBUG: Total hexload.com links found: {hexload_count}")
-        print(f"  DEBUG: Links matching query '{query}': {matching_count}")
+        with profile_stage('link_extraction'):
+            album_links = extract_album_links(soup, query)
         
         return album_links
     except Exception as e:
@@ -606,6 +915,7 @@ def format_date(date_str):
     return date_str
 
 @app.route('/search', methods=['GET'])
+@profiled
 def search():
     """Search endpoint for forum queries"""
     query = request.args.get('q', '')
@@ -672,7 +982,8 @@ def search():
                     })
                 
                 # Add small delay to avoid overwhelming the server
-                time.sleep(0.5)
+                with profile_stage('throttle'):
+                    time.sleep(0.5)
             except Exception as e:
                 print(f"Error processing post {post['url']}: {e}")
                 continue
@@ -1,7 +1,6 @@
 // DOM Elements
 const searchForm = document.getElementById('searchForm');
 const searchInput = document.getElementById('searchInput');
-const searchButton = document.getElementById('searchButton');
 const resultsDiv = document.getElementById('results');
 const loadingDiv = document.getElementById('loading');
 const errorDiv = document.getElementById('errorMessage');
@@ -10,6 +9,73 @@ const rdStatusBar = document.getElementById('rdStatusBar');
 
 // State
 let realdebridConnected = false;
+let searchController = null;
+let shownQuery = null;
+const pendingRequests = {};
+
+// Cache TTLs (milliseconds)
+const SEARCH_CACHE_TTL = 10 * 60 * 1000;
+const UNRESTRICT_CACHE_TTL = 30 * 60 * 1000;
+const STATUS_CACHE_TTL = 60 * 1000;
+
+// Cache Functions (sessionStorage, entries expire after their TTL)
+function cacheGet(key) {
+    try {
+        const raw = sessionStorage.getItem(key);
+        if (!raw) return null;
+        const entry = JSON.parse(raw);
+        if (Date.now() > entry.expires) {
+            sessionStorage.removeItem(key);
+            return null;
+        }
+        return entry.value;
+    } catch (error) {
+        return null;
+    }
+}
+
+function cacheSet(key, value, ttl) {
+    try {
+        sessionStorage.setItem(key, JSON.stringify({ value: value, expires: Date.now() + ttl }));
+    } catch (error) {
+        // Storage full or unavailable - caching is best effort
+        console.warn('Unable to cache response:', error);
+    }
+}
+
+function cacheClear(prefix) {
+    try {
+        Object.keys(sessionStorage)
+            .filter(key => key.startsWith(prefix))
+            .forEach(key => sessionStorage.removeItem(key));
+    } catch (error) {
+        // Ignore - nothing to clear
+    }
+}
+
+// Fetch a status endpoint, reusing a fresh cached response or an identical in-flight request
+function fetchStatus(url) {
+    const cacheKey = `status:${url}`;
+    const cached = cacheGet(cacheKey);
+    if (cached) {
+        return Promise.resolve(cached);
+    }
+    if (!pendingRequests[url]) {
+        pendingRequests[url] = fetch(url, { credentials: 'include' })
+            .then(async response => {
+                const data = await response.json();
+                // Don't cache failures or error payloads - they may be transient
+                if (response.ok && !data.error) {
+                    cacheSet(cacheKey, data, STATUS_CACHE_TTL);
+                }
+                return data;
+            })
+            .finally(() => {
+                delete pendingRequests[url];
+            });
+    }
+    return pendingRequests[url];
+}
 
 // Utility Functions
 function showError(message) {
@@ -21,14 +87,13 @@ function showError(message) {
 }
 
 function showLoading() {
+    // The search button stays enabled so a new search can supersede (abort) the one in flight
     loadingDiv.classList.add('active');
-    searchButton.disabled = true;
     resultsDiv.innerHTML = '';
 }
 
 function hideLoading() {
     loadingDiv.classList.remove('active');
-    searchButton.disabled = false;
 }
 
 function updateStatusBar(loggedIn, errorMessage = '') {
@@ -46,10 +111,7 @@ function updateStatusBar(loggedIn, errorMessage = '') {
 // Authentication Functions
 async function checkAuthStatus(showPrompt = false) {
     try {
-        const response = await fetch('/auth-status', {
-            credentials: 'include'
-        });
-        const data = await response.json();
+        const data = await fetchStatus('/auth-status');
         updateStatusBar(data.loggedIn, data.error);
         if (!data.loggedIn && showPrompt) {
             displayLoginPrompt('You are not logged in. Use the instructions below to export cookies.');
@@ -107,10 +169,7 @@ function formatResult(result, query) {
 // Real-Debrid Functions
 async function checkRealDebridStatus() {
     try {
-        const response = await fetch('/realdebrid/status', {
-            credentials: 'include'
-        });
-        const data = await response.json();
+        const data = await fetchStatus('/realdebrid/status');
         realdebridConnected = !!data.connected;
         
         rdStatusBar.classList.toggle('logged-in', realdebridConnected);
@@ -189,6 +248,8 @@ function showRealDebridTokenInput() {
             
             if (data.success) {
                 showError(`Real-Debrid connected successfully! (${data.username})`);
+                cacheClear('status:/realdebrid/');
+                cacheClear('unrestrict:');
                 await checkRealDebridStatus();
                 // Refresh results to show Real-Debrid buttons
                 if (resultsDiv.innerHTML && !resultsDiv.innerHTML.includes('no-results')) {
@@ -219,6 +280,14 @@ async function handleRealDebridUnrestrict(link, albumName) {
         return;
     }
     
+    const cacheKey = `unrestrict:${link}`;
+    const cached = cacheGet(cacheKey);
+    if (cached) {
+        window.open(cached.download, '_blank');
+        showError('Unrestricted link generated! Download started in new tab.');
+        return;
+    }
+    
     try {
         showError('Unrestricting link via Real-Debrid...');
         const response = await fetch('/realdebrid/unrestrict', {
@@ -235,6 +304,8 @@ async function handleRealDebridUnrestrict(link, albumName) {
             if (data.error.includes('not connected') || data.error.includes('expired') || data.error.includes('invalid')) {
                 showError('Real-Debrid connection expired. Please reconnect your account.');
                 realdebridConnected = false;
+                cacheClear('status:/realdebrid/');
+                cacheClear('unrestrict:');
                 await checkRealDebridStatus();
             } else {
                 showError(`Real-Debrid error: ${data.error}`);
@@ -242,6 +313,8 @@ async function handleRealDebridUnrestrict(link, albumName) {
             return;
         }
         
+        cacheSet(cacheKey, data, UNRESTRICT_CACHE_TTL);
+        
         // Open unrestricted link to start download
         window.open(data.download, '_blank');
         showError('Unrestricted link generated! Download started in new tab.');
@@ -301,6 +374,8 @@ function displayLoginPrompt(message = '') {
             const data = await response.json();
             if (data.success) {
                 showError('Cookies uploaded and validated! Trying search again...');
+                cacheClear('status:/auth-status');
+                cacheClear('search:');
                 checkAuthStatus();
                 setTimeout(() => searchForm.dispatchEvent(new Event('submit')), 1000);
             } else {
@@ -347,25 +422,63 @@ searchForm.addEventListener('submit', async (e) => {
         showError('Please enter a search query');
         return;
     }
+    
+    // Abort any search still in flight - its results would be stale
+    if (searchController) {
+        searchController.abort();
+        searchController = null;
+    }
+    
+    // Re-submitting the query already on screen is an explicit refresh, so skip the cache.
+    // Programmatic re-submits (e.g. after connecting Real-Debrid) aren't trusted events and still use it.
+    const cacheKey = `search:${query.toLowerCase()}`;
+    const refresh = e.isTrusted && shownQuery === query.toLowerCase();
+    const cached = refresh ? null : cacheGet(cacheKey);
+    if (cached) {
+        hideLoading();
+        displayResults(cached, query);
+        shownQuery = query.toLowerCase();
+        return;
+    }
+    shownQuery = null;
+    
+    const controller = new AbortController();
+    searchController = controller;
     showLoading();
     try {
         const response = await fetch(`/search?q=${encodeURIComponent(query)}`, {
-            credentials: 'include'
+            credentials: 'include',
+            signal: controller.signal
         });
         const data = await response.json();
         if (!response.ok) {
             throw new Error(data.error || 'Search failed');
         }
         if (data.requiresAuth) {
+            // The cached auth status is stale if the forum rejected our cookies
+            cacheClear('status:/auth-status');
+            checkAuthStatus();
             displayLoginPrompt();
         } else {
-            displayResults(data.results || [], query);
+            const results = data.results || [];
+            // Empty responses may come from a failed forum fetch, so never cache them
+            if (results.length > 0) {
+                cacheSet(cacheKey, results, SEARCH_CACHE_TTL);
+            }
+            displayResults(results, query);
+            shownQuery = query.toLowerCase();
         }
     } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
         showError(`Error: ${error.message}`);
         resultsDiv.innerHTML = '';
     } finally {
-        hideLoading();
+        if (searchController === controller) {
+            searchController = null;
+            hideLoading();
+        }
     }
 });
 